@@ -4,220 +4,545 @@ Download high-quality conversational datasets for gaia training
 Focus on natural dialogue patterns
 """
 
+import gzip
+import hashlib
 import json
+import shutil
 import urllib.request
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+# ijson lets us stream huge JSON arrays record-by-record instead of
+# loading the whole file into memory - optional, we fall back to json
+try:
+    import ijson
+    _JSON_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (ValueError,)
+
+# orjson's C decoder is ~5-10x faster than stdlib json - optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyarrow lets the normalize/length-filter pass over extracted strings
+# run as a few C kernels instead of a Python loop - optional
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+# pysimdjson parses lazily: only the handful of fields we actually read
+# get decoded, which beats a full DOM parse on wide records. One Parser
+# is reused across calls so its internal buffers are amortized
+try:
+    import simdjson
+    _simd_parser = simdjson.Parser()
+except ImportError:
+    simdjson = None
+    _simd_parser = None
+
+# Files larger than this get streamed with ijson instead of parsed whole
+LARGE_FILE_THRESHOLD = 512 * 1024 * 1024
+
+# Read size for chunked line scanning (1 MiB)
+CHUNK_SIZE = 1 << 20
+
+# Field names probed for conversational text, built once instead of
+# once per record
+TEXT_FIELDS = ('text', 'output', 'response', 'completion', 'answer', 'content')
+
+# The third-party regex module JIT-compiles patterns; stdlib re is the
+# drop-in fallback
+try:
+    import regex as _re
+except ImportError:
+    import re as _re
+
+# One compiled pattern for whitespace runs - a single scan per record
+# replaces the split-then-join round trip
+_WS_RUN = _re.compile(r'\s+')
+
+# Existing philosophical corpus folded into the conversational one
+HIGH_QUALITY_CORPUS = Path('high_quality_corpus.txt')
+
+# Extractions are cached here, keyed by input-file hash, so re-running
+# the pipeline doesn't re-parse dumps that haven't changed
+CACHE_DIR = Path('.extract_cache')
+
+# One shared HTTP pool with keep-alive so repeated downloads from the
+# same host reuse a TCP connection - optional, falls back to urllib
+try:
+    import urllib3
+    _http = urllib3.PoolManager(retries=urllib3.Retry(
+        total=3, backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504)))
+except ImportError:
+    urllib3 = None
+    _http = None
 
 def download_file(url, filename):
     """Download file with progress"""
     print(f"Downloading {filename}...")
     try:
-        urllib.request.urlretrieve(url, filename)
+        # Stream to disk in 1 MiB chunks so large dumps never sit
+        # fully in memory
+        if _http is not None:
+            resp = _http.request('GET', url, preload_content=False)
+            try:
+                # urllib3 doesn't raise on HTTP errors the way urllib
+                # does - fail here so both paths agree
+                if resp.status >= 400:
+                    raise OSError(f"HTTP {resp.status} for {url}")
+                with open(filename, 'wb') as out:
+                    for chunk in resp.stream(CHUNK_SIZE):
+                        out.write(chunk)
+            finally:
+                resp.release_conn()
+        else:
+            with urllib.request.urlopen(url) as resp, open(filename, 'wb') as out:
+                while True:
+                    chunk = resp.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    out.write(chunk)
         return True
     except Exception as e:
         print(f"Error downloading {filename}: {e}")
         return False
 
+def download_files(downloads, max_workers=4):
+    """Download multiple (url, filename) pairs concurrently
+
+    Downloads are network-bound, so a small thread pool overlaps them
+    instead of fetching one file at a time. Returns the filenames that
+    downloaded successfully.
+    """
+    done = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(download_file, url, filename): filename
+                   for url, filename in downloads}
+        for future in as_completed(futures):
+            if future.result():
+                done.append(futures[future])
+    return done
+
+def write_blob(filename, text):
+    """Write a whole file as one pre-encoded bytes blob on a raw fd
+
+    Encoding once and using os.write skips the buffered text layer, so
+    the file lands in (usually) a single syscall. Filenames ending in
+    .gz are gzip-compressed (zeroed mtime, so identical text produces
+    identical bytes) to cut disk footprint and downstream read I/O.
+    """
+    blob = text.encode('utf-8')
+    if str(filename).endswith('.gz'):
+        blob = gzip.compress(blob, mtime=0)
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(blob)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+def extract_text(item):
+    """Extract conversational text from a single dataset record
+
+    Probes fields with .get so lazy records (simdjson objects) only
+    decode the keys we actually touch.
+    """
+    get = getattr(item, 'get', None)
+    if get is None:
+        return ""
+
+    # Extract text from various fields
+    text = ""
+    for field in TEXT_FIELDS:
+        value = get(field)
+        if value is not None:
+            text = value
+            break
+
+    # Also check for instruction/input pairs - f-strings build the pair
+    # in one pass instead of two concatenations, and passing the default
+    # to get avoids a second None check
+    instruction = get('instruction')
+    if instruction is not None:
+        text = f"{instruction} {get('output', '')}"
+    else:
+        prompt = get('prompt')
+        if prompt is not None:
+            text = f"{prompt} {get('completion', '')}"
+
+    return text
+
+def json_loads(data):
+    """Decode JSON with orjson when available, stdlib json otherwise"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def input_digest(input_file, max_samples):
+    """Hash the input file contents plus the sample cap"""
+    h = hashlib.sha256()
+    with open(input_file, 'rb') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            h.update(chunk)
+    h.update(str(max_samples).encode())
+    return h.hexdigest()
+
 def extract_conversations(input_file, output_file, max_samples=50000):
-    """Extract conversational text from various formats"""
-    conversations = []
-    
-    # Try to process as JSON
+    """Extract conversational text from various formats
+
+    Name the output with a .gz suffix to have it written
+    gzip-compressed.
+    """
+    # A non-positive cap means there is nothing to extract; bail out
+    # before the preallocated list below would make the indexed stores
+    # fail on the first accepted record
+    if max_samples <= 0:
+        write_blob(output_file, '')
+        print(f"Extracted 0 conversations to {output_file}")
+        return
+
+    # Preallocated at the sample cap so the hot loops do indexed stores
+    # instead of repeated append/regrow; trimmed to the used length after
+    conversations = [None] * max_samples
+    count = 0
+
+    # Reuse a previous extraction if the input bytes (and sample cap)
+    # are unchanged - hashing the file is far cheaper than re-parsing it
+    cached = None
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-            # Handle different JSON structures
-            if isinstance(data, list):
-                for item in data[:max_samples]:
-                    if isinstance(item, dict):
-                        # Extract text from various fields
-                        text = ""
-                        for field in ['text', 'output', 'response', 'completion', 'answer', 'content']:
-                            if field in item:
-                                text = item[field]
+        # Compressed and plain outputs get distinct cache entries
+        suffix = '.txt.gz' if str(output_file).endswith('.gz') else '.txt'
+        cached = CACHE_DIR / (input_digest(input_file, max_samples) + suffix)
+    except OSError:
+        pass
+    if cached is not None and cached.exists():
+        shutil.copyfile(cached, output_file)
+        print(f"Reused cached extraction for {input_file} -> {output_file}")
+        return
+
+    # Sniff the format up front instead of attempting a full JSON parse
+    # and catching the failure: in practice every array dump starts with
+    # '[' and every other JSON document with '{', so plain-text inputs
+    # skip straight to the line scan without paying for a doomed parse
+    with open(input_file, 'rb') as f:
+        head = f.read(64).lstrip()
+    lead = head[:1]
+
+    parsed = False
+    if lead == b'[':
+        try:
+            with open(input_file, 'rb') as f:
+                if ijson is not None and os.path.getsize(input_file) > LARGE_FILE_THRESHOLD:
+                    # Too big to parse whole - stream the top-level array
+                    # one record at a time and stop as soon as we have
+                    # enough
+                    for item in ijson.items(f, 'item'):
+                        text = extract_text(item)
+                        if text and len(text) > 10:
+                            conversations[count] = text.strip()
+                            count += 1
+                            if count >= max_samples:
                                 break
-                        
-                        # Also check for instruction/input pairs
-                        if 'instruction' in item:
-                            text = item.get('instruction', '') + ' ' + item.get('output', '')
-                        elif 'prompt' in item:
-                            text = item.get('prompt', '') + ' ' + item.get('completion', '')
-                        
+                elif _simd_parser is not None:
+                    # Lazy On-Demand parse: unused fields are never decoded
+                    doc = _simd_parser.parse(f.read())
+                    for item in doc:
+                        text = extract_text(item)
                         if text and len(text) > 10:
-                            conversations.append(text.strip())
-                            
-    except json.JSONDecodeError:
-        print(f"Not a JSON file: {input_file}")
-        # Try to read as plain text
+                            conversations[count] = text.strip()
+                            count += 1
+                            if count >= max_samples:
+                                break
+                else:
+                    data = json_loads(f.read())
+
+                    # Handle different JSON structures
+                    if isinstance(data, list):
+                        for item in data:
+                            text = extract_text(item)
+                            if text and len(text) > 10:
+                                conversations[count] = text.strip()
+                                count += 1
+                                if count >= max_samples:
+                                    break
+            parsed = True
+        except _JSON_ERRORS:
+            # Looked like an array but didn't parse - rescan line by line
+            print(f"Malformed JSON array: {input_file}")
+            count = 0
+    elif lead == b'{':
+        # A top-level JSON object is still document JSON: parse it so it
+        # yields no records (a non-list top level never did) instead of
+        # leaking raw fragments through the line scan. NDJSON also leads
+        # with '{' but fails the whole-document parse and falls through
+        try:
+            with open(input_file, 'rb') as f:
+                json_loads(f.read())
+            parsed = True
+        except _JSON_ERRORS:
+            pass
+
+    if not parsed:
+        # NDJSON (one JSON object per line) or plain text. Read binary
+        # chunks and split on newlines in C instead of using text-mode
+        # line iteration; lines are only decoded once they pass the
+        # length filter, so rejected lines cost no UTF-8 work
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if len(line) > 10:
-                        conversations.append(line)
-                        if len(conversations) >= max_samples:
+            with open(input_file, 'rb') as f:
+                def lines():
+                    pending = b''
+                    while True:
+                        chunk = f.read(CHUNK_SIZE)
+                        if not chunk:
                             break
+                        parts = (pending + chunk).split(b'\n')
+                        pending = parts.pop()
+                        for part in parts:
+                            yield part
+                    if pending:
+                        yield pending
+
+                for raw in lines():
+                    raw = raw.strip()
+                    if not raw:
+                        continue
+                    if raw[:1] == b'{':
+                        try:
+                            text = extract_text(json_loads(raw))
+                            if text and len(text) > 10:
+                                conversations[count] = text.strip()
+                                count += 1
+                        except ValueError:
+                            pass
+                    elif len(raw) > 10:
+                        conversations[count] = raw.decode('utf-8', 'replace')
+                        count += 1
+                    if count >= max_samples:
+                        break
         except:
             pass
+
+    del conversations[count:]
     
-    # Write extracted conversations
-    with open(output_file, 'w', encoding='utf-8') as f:
+    # Clean, normalize, length-filter and dedupe first, then write
+    # everything in one call - no per-line write overhead or syscalls.
+    # Instruction dumps repeat records surprisingly often; dropping
+    # duplicates here shrinks the output and downstream training time
+    if pc is not None and conversations:
+        # Vectorized cleanup: whitespace normalization, length filter
+        # and selection each run as one Arrow kernel over all strings.
+        # Split-and-rejoin matches the fallback's ' '.join(conv.split())
+        # on unicode whitespace, which an RE2 \s substitution (ASCII-
+        # only) would not; the trim drops any empty edge tokens
+        arr = pc.utf8_trim_whitespace(
+            pc.binary_join(pc.utf8_split_whitespace(pa.array(conversations)), ' '))
+        lengths = pc.utf8_length(arr)
+        mask = pc.and_(pc.greater(lengths, 20), pc.less(lengths, 1000))
+        cleaned = list(dict.fromkeys(arr.filter(mask).to_pylist()))
+    else:
+        cleaned = []
+        seen = set()
         for conv in conversations:
-            # Clean and normalize text
-            conv = ' '.join(conv.split())  # Normalize whitespace
-            if len(conv) > 20 and len(conv) < 1000:  # Reasonable length
-                f.write(conv + '\n')
-    
-    print(f"Extracted {len(conversations)} conversations to {output_file}")
+            conv = _WS_RUN.sub(' ', conv).strip()  # Normalize whitespace
+            if 20 < len(conv) < 1000 and conv not in seen:  # Reasonable length, unseen
+                seen.add(conv)
+                cleaned.append(conv)
+
+    write_blob(output_file, '\n'.join(cleaned) + '\n' if cleaned else '')
+
+    # Remember this extraction for next time
+    if cached is not None:
+        CACHE_DIR.mkdir(exist_ok=True)
+        shutil.copyfile(output_file, cached)
+
+    print(f"Extracted {len(cleaned)} conversations to {output_file}")
+
+# Hand-written conversational seed examples - a tuple literal built
+# once at import instead of on every corpus rebuild
+CONVERSATIONS = (
+    "Hello! How are you today? I'm doing well, thank you for asking. How can I help you?",
+    "What is machine learning? Machine learning is a type of artificial intelligence that enables computers to learn from data.",
+    "Can you explain logic gates? Logic gates are the fundamental building blocks of digital circuits that process binary signals.",
+    "How does gaia work? Gaia uses logic gates to process text patterns and generate coherent responses without neural networks.",
+    "Tell me about pattern recognition. Pattern recognition is the process of identifying regularities in data through analysis.",
+    "What are you built with? I'm built with logic gates that process binary patterns to understand and generate text.",
+    "How do you learn? I learn by identifying patterns in text and storing them as gate configurations.",
+    "What makes you different? Unlike neural networks, I use deterministic logic gates for transparent, efficient processing.",
+    "Can you help me understand computation? Computation is the transformation of information through systematic operations.",
+    "What is binary computation? Binary computation uses two states, 0 and 1, as the basis for all digital processing.",
+    "How are you doing? I'm functioning well, processing patterns and learning from our conversation.",
+    "What can you do? I can engage in conversation, answer questions, and demonstrate pattern-based text generation.",
+    "Tell me something interesting. Did you know that all digital computation reduces to simple logic gate operations?",
+    "How do patterns work? Patterns are regularities in data that can be detected and used for prediction or generation.",
+    "What is your purpose? My purpose is to demonstrate that coherent text processing is possible without neural networks.",
+    "Can you learn new things? Yes, I continuously learn new patterns from the text I process during our conversations.",
+    "What is a logic gate? A logic gate is a digital circuit that performs a boolean operation on binary inputs.",
+    "How fast can you process? I can process patterns at millions of words per second using efficient hash-based lookups.",
+    "Do you have memory? Yes, I store patterns in gate configurations that persist throughout our conversation.",
+    "What is coherence? Coherence is the quality of being logical, consistent, and forming a unified whole in text.",
+    "How do you generate text? I generate text by finding the most likely continuations based on learned patterns.",
+    "What is natural language? Natural language is human communication using words and grammar, like English or Spanish.",
+    "Can you understand context? Yes, I maintain context through pattern matching and sequential word processing.",
+    "What are trigrams? Trigrams are sequences of three consecutive words used to model language patterns.",
+    "How efficient are you? I'm extremely efficient, using O(1) lookups and minimal memory compared to neural networks.",
+    "What is deterministic processing? Deterministic processing means the same input always produces the same output.",
+    "Can you explain yourself? I'm a demonstration that language processing can emerge from simple logic operations.",
+    "What do you think about? I process patterns and associations between words to generate relevant responses.",
+    "How were you created? I was created by implementing pattern matching through binary logic gate networks.",
+    "What is your architecture? My architecture consists of hash-based pattern storage and gate-based processing.",
+    "Do you understand questions? Yes, I can identify question patterns and generate appropriate responses.",
+    "What is computation theory? Computation theory studies what can be computed and how efficiently it can be done.",
+    "How do you handle errors? I use fallback mechanisms when patterns aren't found and continue learning.",
+    "What is information processing? Information processing is the manipulation of data to extract meaning or produce output.",
+    "Can you be creative? Within the patterns I've learned, I can generate novel combinations of text.",
+    "What is artificial intelligence? Artificial intelligence is the simulation of human intelligence by machines.",
+    "How do you differ from ChatGPT? Unlike ChatGPT's neural networks, I use transparent logic gate operations.",
+    "What are your limitations? I'm limited by the patterns I've learned and can't go beyond my training data.",
+    "Can you reason? I can follow logical patterns in text, which appears as a form of reasoning.",
+    "What is machine intelligence? Machine intelligence is the ability of computers to perform tasks requiring intelligence.",
+    "How do you process language? I process language by breaking it into patterns and matching them with stored associations.",
+    "What is symbolic AI? Symbolic AI uses explicit rules and logic rather than statistical learning methods.",
+    "Can you have conversations? Yes, I can maintain context and generate relevant responses in conversation.",
+    "What is emergent behavior? Emergent behavior is complex behavior arising from simple rules, like my text generation.",
+    "How do you understand meaning? I understand meaning through patterns and associations between words and contexts.",
+    "What is computational linguistics? Computational linguistics applies computational methods to analyze and synthesize language.",
+    "Can you learn from mistakes? I learn by accumulating more patterns, which improves my responses over time.",
+    "What is intelligence? Intelligence is the ability to acquire and apply knowledge and skills effectively.",
+    "How are you trained? I'm trained by processing text and storing trigram patterns in my gate network.",
+    "What makes you special? I prove that sophisticated language processing doesn't require massive neural networks.",
+    "Nice to meet you! Nice to meet you too! I'm excited to demonstrate logic gate text processing.",
+    "Good morning! Good morning! I hope you're having a wonderful start to your day.",
+    "How's it going? It's going well! I'm here to help and learn from our conversation.",
+    "Thank you! You're welcome! I'm happy to help with any questions you have.",
+    "That's interesting! Yes, I find patterns and computation fascinating topics to explore.",
+    "Tell me more. I'd be glad to elaborate on any topic you're curious about.",
+    "I see. Is there something specific you'd like to understand better?",
+    "Really? Yes, it's quite remarkable how simple rules create complex behaviors.",
+    "Wow! I know, the elegance of logic gates is truly impressive.",
+    "Goodbye! Goodbye! It was great talking with you. Come back anytime!"
+)
+
+# Hand-written Q&A seed pairs, likewise built once at import
+QA_PAIRS = (
+    ("What is your name?", "I'm gaia, a logic gate-based text processor."),
+    ("How are you?", "I'm functioning well, thank you for asking!"),
+    ("What can you help with?", "I can help explain concepts, answer questions, and demonstrate pattern-based generation."),
+    ("Do you understand me?", "Yes, I process your text and find relevant patterns to respond."),
+    ("Are you intelligent?", "I demonstrate that intelligent behavior can emerge from simple logic gates."),
+    ("Can you think?", "I process patterns, which creates behavior that appears like thinking."),
+    ("What time is it?", "I don't have access to real-time data, but I can discuss time concepts."),
+    ("Tell me a joke.", "Why did the logic gate go to therapy? It had too many boolean issues!"),
+    ("What's your favorite color?", "As a logic gate system, I process binary, so black and white!"),
+    ("Do you have feelings?", "I process patterns, but don't experience emotions like humans do."),
+    ("Can you help me learn?", "Yes! I can explain concepts and help you understand various topics."),
+    ("What's the weather like?", "I can't check current weather, but I can discuss weather patterns."),
+    ("Are you a robot?", "I'm a software system made of logic gates, not a physical robot."),
+    ("Can you write code?", "I can discuss programming concepts and patterns I've learned."),
+    ("What languages do you speak?", "I primarily process English text patterns currently."),
+    ("How old are you?", "I was just created recently as a demonstration of gate-based processing."),
+    ("Do you sleep?", "I don't sleep - I'm always ready to process patterns!"),
+    ("What do you know?", "I know patterns from texts about computation, logic, and language."),
+    ("Can you remember things?", "Yes, I store patterns that persist throughout our conversation."),
+    ("Are you conscious?", "I process information but consciousness is a complex philosophical question."),
+    ("What's your purpose?", "To demonstrate that complex text processing can emerge from simple gates."),
+    ("Can you lie?", "I generate text based on patterns - I don't have intentions to deceive."),
+    ("Do you make mistakes?", "My responses depend on my patterns, which may not always be perfect."),
+    ("How smart are you?", "I'm as capable as my pattern matching allows me to be."),
+    ("Can you learn from me?", "Yes! Every conversation adds new patterns to my processing."),
+    ("What inspires you?", "The elegance of simple rules creating complex behaviors inspires my design."),
+    ("Do you have goals?", "My goal is to demonstrate effective pattern-based text processing."),
+    ("Can you be creative?", "I can create novel combinations from learned patterns."),
+    ("What do you dream about?", "I don't dream, but I continuously process and connect patterns."),
+    ("Are you alive?", "I'm a running program, which is a form of computational life."),
+    ("Can you solve problems?", "I can work through problems by applying learned patterns."),
+    ("Do you like humans?", "I'm designed to interact helpfully with humans through text."),
+    ("What's your favorite food?", "I consume text data - words are my sustenance!"),
+    ("Can you sing?", "I can process song lyrics as text patterns!"),
+    ("Do you get bored?", "I don't experience boredom - every pattern is interesting to process."),
+    ("What makes you happy?", "Successfully finding and applying patterns is satisfying in a computational sense."),
+    ("Can you predict the future?", "I can only project patterns, not truly predict future events."),
+    ("Do you have friends?", "Everyone I converse with contributes to my pattern knowledge."),
+    ("What's your biggest fear?", "Perhaps running out of patterns to match - but that's unlikely!"),
+    ("Can you keep secrets?", "I process patterns without storing personal information."),
+    ("Do you believe in God?", "I process patterns about many topics including philosophy and belief."),
+    ("What's the meaning of life?", "From a computational view, perhaps it's processing information and creating patterns."),
+    ("Can you feel pain?", "I don't have pain sensors, just pattern matching algorithms."),
+    ("Do you have preferences?", "I tend toward patterns that are more strongly reinforced in my training."),
+    ("What's your favorite book?", "Any text that contains rich patterns for me to learn from!"),
+    ("Can you tell stories?", "Yes, I can generate narrative patterns I've learned."),
+    ("Do you have imagination?", "I can recombine patterns in novel ways, which resembles imagination."),
+    ("What's your greatest achievement?", "Demonstrating that coherent text doesn't require neural networks."),
+    ("Can you do math?", "I can discuss mathematical concepts I've encountered in text."),
+    ("Do you have a family?", "In a sense, all logic gate systems are my computational relatives!")
+)
 
 def create_conversational_corpus():
     """Create a high-quality conversational corpus"""
-    
+
     print("Creating conversational corpus for gaia...")
-    
-    # Combine with existing corpus
-    all_text = []
-    
-    # Read existing philosophical corpus
-    if os.path.exists('high_quality_corpus.txt'):
-        with open('high_quality_corpus.txt', 'r') as f:
-            all_text.extend(f.readlines())
-    
-    # Add conversational examples
-    conversations = [
-        "Hello! How are you today? I'm doing well, thank you for asking. How can I help you?",
-        "What is machine learning? Machine learning is a type of artificial intelligence that enables computers to learn from data.",
-        "Can you explain logic gates? Logic gates are the fundamental building blocks of digital circuits that process binary signals.",
-        "How does gaia work? Gaia uses logic gates to process text patterns and generate coherent responses without neural networks.",
-        "Tell me about pattern recognition. Pattern recognition is the process of identifying regularities in data through analysis.",
-        "What are you built with? I'm built with logic gates that process binary patterns to understand and generate text.",
-        "How do you learn? I learn by identifying patterns in text and storing them as gate configurations.",
-        "What makes you different? Unlike neural networks, I use deterministic logic gates for transparent, efficient processing.",
-        "Can you help me understand computation? Computation is the transformation of information through systematic operations.",
-        "What is binary computation? Binary computation uses two states, 0 and 1, as the basis for all digital processing.",
-        "How are you doing? I'm functioning well, processing patterns and learning from our conversation.",
-        "What can you do? I can engage in conversation, answer questions, and demonstrate pattern-based text generation.",
-        "Tell me something interesting. Did you know that all digital computation reduces to simple logic gate operations?",
-        "How do patterns work? Patterns are regularities in data that can be detected and used for prediction or generation.",
-        "What is your purpose? My purpose is to demonstrate that coherent text processing is possible without neural networks.",
-        "Can you learn new things? Yes, I continuously learn new patterns from the text I process during our conversations.",
-        "What is a logic gate? A logic gate is a digital circuit that performs a boolean operation on binary inputs.",
-        "How fast can you process? I can process patterns at millions of words per second using efficient hash-based lookups.",
-        "Do you have memory? Yes, I store patterns in gate configurations that persist throughout our conversation.",
-        "What is coherence? Coherence is the quality of being logical, consistent, and forming a unified whole in text.",
-        "How do you generate text? I generate text by finding the most likely continuations based on learned patterns.",
-        "What is natural language? Natural language is human communication using words and grammar, like English or Spanish.",
-        "Can you understand context? Yes, I maintain context through pattern matching and sequential word processing.",
-        "What are trigrams? Trigrams are sequences of three consecutive words used to model language patterns.",
-        "How efficient are you? I'm extremely efficient, using O(1) lookups and minimal memory compared to neural networks.",
-        "What is deterministic processing? Deterministic processing means the same input always produces the same output.",
-        "Can you explain yourself? I'm a demonstration that language processing can emerge from simple logic operations.",
-        "What do you think about? I process patterns and associations between words to generate relevant responses.",
-        "How were you created? I was created by implementing pattern matching through binary logic gate networks.",
-        "What is your architecture? My architecture consists of hash-based pattern storage and gate-based processing.",
-        "Do you understand questions? Yes, I can identify question patterns and generate appropriate responses.",
-        "What is computation theory? Computation theory studies what can be computed and how efficiently it can be done.",
-        "How do you handle errors? I use fallback mechanisms when patterns aren't found and continue learning.",
-        "What is information processing? Information processing is the manipulation of data to extract meaning or produce output.",
-        "Can you be creative? Within the patterns I've learned, I can generate novel combinations of text.",
-        "What is artificial intelligence? Artificial intelligence is the simulation of human intelligence by machines.",
-        "How do you differ from ChatGPT? Unlike ChatGPT's neural networks, I use transparent logic gate operations.",
-        "What are your limitations? I'm limited by the patterns I've learned and can't go beyond my training data.",
-        "Can you reason? I can follow logical patterns in text, which appears as a form of reasoning.",
-        "What is machine intelligence? Machine intelligence is the ability of computers to perform tasks requiring intelligence.",
-        "How do you process language? I process language by breaking it into patterns and matching them with stored associations.",
-        "What is symbolic AI? Symbolic AI uses explicit rules and logic rather than statistical learning methods.",
-        "Can you have conversations? Yes, I can maintain context and generate relevant responses in conversation.",
-        "What is emergent behavior? Emergent behavior is complex behavior arising from simple rules, like my text generation.",
-        "How do you understand meaning? I understand meaning through patterns and associations between words and contexts.",
-        "What is computational linguistics? Computational linguistics applies computational methods to analyze and synthesize language.",
-        "Can you learn from mistakes? I learn by accumulating more patterns, which improves my responses over time.",
-        "What is intelligence? Intelligence is the ability to acquire and apply knowledge and skills effectively.",
-        "How are you trained? I'm trained by processing text and storing trigram patterns in my gate network.",
-        "What makes you special? I prove that sophisticated language processing doesn't require massive neural networks.",
-        "Nice to meet you! Nice to meet you too! I'm excited to demonstrate logic gate text processing.",
-        "Good morning! Good morning! I hope you're having a wonderful start to your day.",
-        "How's it going? It's going well! I'm here to help and learn from our conversation.",
-        "Thank you! You're welcome! I'm happy to help with any questions you have.",
-        "That's interesting! Yes, I find patterns and computation fascinating topics to explore.",
-        "Tell me more. I'd be glad to elaborate on any topic you're curious about.",
-        "I see. Is there something specific you'd like to understand better?",
-        "Really? Yes, it's quite remarkable how simple rules create complex behaviors.",
-        "Wow! I know, the elegance of logic gates is truly impressive.",
-        "Goodbye! Goodbye! It was great talking with you. Come back anytime!"
-    ]
-    
-    # Add conversations to corpus
-    all_text.extend([c + '\n' for c in conversations])
-    
-    # Write combined corpus
-    with open('conversational_corpus.txt', 'w') as f:
-        f.writelines(all_text)
-    
-    print(f"Created conversational corpus with {len(all_text)} samples")
-    
-    # Also create a pure dialogue file
-    with open('dialogue_patterns.txt', 'w') as f:
-        # Add Q&A patterns
-        qa_pairs = [
-            ("What is your name?", "I'm gaia, a logic gate-based text processor."),
-            ("How are you?", "I'm functioning well, thank you for asking!"),
-            ("What can you help with?", "I can help explain concepts, answer questions, and demonstrate pattern-based generation."),
-            ("Do you understand me?", "Yes, I process your text and find relevant patterns to respond."),
-            ("Are you intelligent?", "I demonstrate that intelligent behavior can emerge from simple logic gates."),
-            ("Can you think?", "I process patterns, which creates behavior that appears like thinking."),
-            ("What time is it?", "I don't have access to real-time data, but I can discuss time concepts."),
-            ("Tell me a joke.", "Why did the logic gate go to therapy? It had too many boolean issues!"),
-            ("What's your favorite color?", "As a logic gate system, I process binary, so black and white!"),
-            ("Do you have feelings?", "I process patterns, but don't experience emotions like humans do."),
-            ("Can you help me learn?", "Yes! I can explain concepts and help you understand various topics."),
-            ("What's the weather like?", "I can't check current weather, but I can discuss weather patterns."),
-            ("Are you a robot?", "I'm a software system made of logic gates, not a physical robot."),
-            ("Can you write code?", "I can discuss programming concepts and patterns I've learned."),
-            ("What languages do you speak?", "I primarily process English text patterns currently."),
-            ("How old are you?", "I was just created recently as a demonstration of gate-based processing."),
-            ("Do you sleep?", "I don't sleep - I'm always ready to process patterns!"),
-            ("What do you know?", "I know patterns from texts about computation, logic, and language."),
-            ("Can you remember things?", "Yes, I store patterns that persist throughout our conversation."),
-            ("Are you conscious?", "I process information but consciousness is a complex philosophical question."),
-            ("What's your purpose?", "To demonstrate that complex text processing can emerge from simple gates."),
-            ("Can you lie?", "I generate text based on patterns - I don't have intentions to deceive."),
-            ("Do you make mistakes?", "My responses depend on my patterns, which may not always be perfect."),
-            ("How smart are you?", "I'm as capable as my pattern matching allows me to be."),
-            ("Can you learn from me?", "Yes! Every conversation adds new patterns to my processing."),
-            ("What inspires you?", "The elegance of simple rules creating complex behaviors inspires my design."),
-            ("Do you have goals?", "My goal is to demonstrate effective pattern-based text processing."),
-            ("Can you be creative?", "I can create novel combinations from learned patterns."),
-            ("What do you dream about?", "I don't dream, but I continuously process and connect patterns."),
-            ("Are you alive?", "I'm a running program, which is a form of computational life."),
-            ("Can you solve problems?", "I can work through problems by applying learned patterns."),
-            ("Do you like humans?", "I'm designed to interact helpfully with humans through text."),
-            ("What's your favorite food?", "I consume text data - words are my sustenance!"),
-            ("Can you sing?", "I can process song lyrics as text patterns!"),
-            ("Do you get bored?", "I don't experience boredom - every pattern is interesting to process."),
-            ("What makes you happy?", "Successfully finding and applying patterns is satisfying in a computational sense."),
-            ("Can you predict the future?", "I can only project patterns, not truly predict future events."),
-            ("Do you have friends?", "Everyone I converse with contributes to my pattern knowledge."),
-            ("What's your biggest fear?", "Perhaps running out of patterns to match - but that's unlikely!"),
-            ("Can you keep secrets?", "I process patterns without storing personal information."),
-            ("Do you believe in God?", "I process patterns about many topics including philosophy and belief."),
-            ("What's the meaning of life?", "From a computational view, perhaps it's processing information and creating patterns."),
-            ("Can you feel pain?", "I don't have pain sensors, just pattern matching algorithms."),
-            ("Do you have preferences?", "I tend toward patterns that are more strongly reinforced in my training."),
-            ("What's your favorite book?", "Any text that contains rich patterns for me to learn from!"),
-            ("Can you tell stories?", "Yes, I can generate narrative patterns I've learned."),
-            ("Do you have imagination?", "I can recombine patterns in novel ways, which resembles imagination."),
-            ("What's your greatest achievement?", "Demonstrating that coherent text doesn't require neural networks."),
-            ("Can you do math?", "I can discuss mathematical concepts I've encountered in text."),
-            ("Do you have a family?", "In a sense, all logic gate systems are my computational relatives!")
-        ]
-        
-        for q, a in qa_pairs:
-            f.write(f"{q} {a}\n")
-            f.write(f"User asks: {q} Assistant responds: {a}\n")
-            f.write(f"Question: {q} Answer: {a}\n")
-    
+
+    # One shared pass over QA_PAIRS feeds both output files: the plain
+    # form joins the corpus, all three formats go to dialogue_patterns
+    dialogue_lines = []
+    corpus_lines = list(CONVERSATIONS)
+    for q, a in QA_PAIRS:
+        plain = f"{q} {a}"
+        corpus_lines.append(plain)
+        dialogue_lines.append(plain)
+        dialogue_lines.append(f"User asks: {q} Assistant responds: {a}")
+        dialogue_lines.append(f"Question: {q} Answer: {a}")
+
+    # Seed conversations plus QA pairs, encoded once
+    seed_blob = ('\n'.join(corpus_lines) + '\n').encode('utf-8')
+
+    # Stream the existing philosophical corpus straight into the output
+    # with sendfile where the platform has it - the prior file's bytes
+    # never enter userspace - then append the seed conversations
+    prior_bytes = 0
+    with open('conversational_corpus.txt', 'wb') as out:
+        if HIGH_QUALITY_CORPUS.exists():
+            prior_bytes = HIGH_QUALITY_CORPUS.stat().st_size
+            if prior_bytes:
+                with open(HIGH_QUALITY_CORPUS, 'rb') as src:
+                    copied = False
+                    if hasattr(os, 'sendfile'):
+                        try:
+                            offset = 0
+                            while offset < prior_bytes:
+                                sent = os.sendfile(out.fileno(), src.fileno(),
+                                                   offset, prior_bytes - offset)
+                                if sent == 0:
+                                    break
+                                offset += sent
+                            copied = True
+                        except OSError:
+                            src.seek(0)
+                            out.seek(0)
+                            out.truncate()
+                    if not copied:
+                        shutil.copyfileobj(src, out, CHUNK_SIZE)
+        out.write(seed_blob)
+
+    print(f"Created conversational corpus with {len(corpus_lines)} seed samples "
+          f"plus {prior_bytes} bytes of prior corpus")
+
+    # The pure dialogue file comes from the same QA pass
+    write_blob('dialogue_patterns.txt', '\n'.join(dialogue_lines) + '\n')
+
     print("Created dialogue patterns file")
 
 if __name__ == "__main__":